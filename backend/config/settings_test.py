@@ -1,11 +1,20 @@
 """Test settings for running tests with SQLite database."""
 
+import atexit
 import os
+import shutil
+import tempfile
 
 os.environ['DEBUG'] = 'True'
 os.environ['DJANGO_ENV'] = 'test'
 os.environ.setdefault('PUBLIC_FRONTEND_URL', 'http://localhost:5173')
 
+# Keep uploads written by tests out of the repository's media/ directory.
+if 'MEDIA_ROOT' not in os.environ:
+    _test_media_root = tempfile.mkdtemp(prefix='openfarmplanner-test-media-')
+    atexit.register(shutil.rmtree, _test_media_root, ignore_errors=True)
+    os.environ['MEDIA_ROOT'] = _test_media_root
+
 from .settings import *  # noqa: F403, F401
 
 # Override database to use SQLite for tests
@@ -23,3 +32,7 @@ REST_FRAMEWORK['DEFAULT_PERMISSION_CLASSES'] = [  # type: ignore[name-defined]
     'rest_framework.permissions.AllowAny',
 ]
 REST_FRAMEWORK['DEFAULT_THROTTLE_CLASSES'] = []  # type: ignore[name-defined]
+
+# Fixture users are created with create_user(); the default PBKDF2 hasher is
+# deliberately slow and would dominate setup time.
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.9 on 2026-10-17 13:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('farm', '0084_remove_public_culture_supplier_fields'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='plantingplan',
+            index=models.Index(fields=['bed', 'planting_date', 'harvest_end_date'], name='farm_planti_bed_id_c723d7_idx'),
+        ),
+    ]
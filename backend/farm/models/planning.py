@@ -161,6 +161,7 @@ class PlantingPlan(TimestampedModel):
         indexes = [
             models.Index(fields=['project', '-planting_date']),
             models.Index(fields=['project', 'bed', 'planting_date', 'harvest_end_date']),
+            models.Index(fields=['bed', 'planting_date', 'harvest_end_date']),
             models.Index(fields=['project', 'culture']),
         ]
 
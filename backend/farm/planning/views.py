@@ -141,7 +141,7 @@ class PlantingPlanViewSet(ProjectScopedMixin, ProjectRevisionMixin, viewsets.Mod
                 return Response({'detail': 'exclude_plan_id not found in active project.'}, status=status.HTTP_400_BAD_REQUEST)
 
         try:
-            payload = calculate_remaining_bed_area(
+            remaining = calculate_remaining_bed_area(
                 bed_id=params['bed_id'],
                 start_date=params['start_date'],
                 end_date=params['end_date'],
@@ -153,10 +153,10 @@ class PlantingPlanViewSet(ProjectScopedMixin, ProjectRevisionMixin, viewsets.Mod
             return Response({'detail': 'Bed not found.'}, status=status.HTTP_404_NOT_FOUND)
 
         return Response({
-            'bed_id': payload['bed_id'],
-            'bed_area_sqm': float(payload['bed_area_sqm']),
-            'overlapping_used_area_sqm': float(payload['overlapping_used_area_sqm']),
-            'remaining_area_sqm': float(payload['remaining_area_sqm']),
+            'bed_id': remaining.bed_id,
+            'bed_area_sqm': float(remaining.bed_area_sqm),
+            'overlapping_used_area_sqm': float(remaining.overlapping_used_area_sqm),
+            'remaining_area_sqm': float(remaining.remaining_area_sqm),
             'start_date': params['start_date'].isoformat(),
             'end_date': params['end_date'].isoformat(),
         })
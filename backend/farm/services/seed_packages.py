@@ -5,20 +5,20 @@ from decimal import Decimal, ROUND_CEILING
 from typing import Iterable
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackageOption:
     size_value: Decimal
     size_unit: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PackageSelection:
     size_value: Decimal
     size_unit: str
     count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SeedPackageSuggestion:
     selection: list[PackageSelection]
     total_amount: Decimal
@@ -26,37 +26,21 @@ class SeedPackageSuggestion:
     pack_count: int
 
 
-@dataclass(frozen=True)
-class _SuggestionMetrics:
-    weighted_score: Decimal
-    pack_count: int
-    excessive_small_pack_count: int
-    small_pack_count: int
-    distinct_sizes: int
-    overage: Decimal
-    larger_pack_bias: tuple[Decimal, ...]
-
-
-def _metrics_sort_key(metrics: _SuggestionMetrics) -> tuple[Decimal, int, int, int, int, Decimal, tuple[Decimal, ...]]:
-    return (
-        metrics.weighted_score,
-        metrics.pack_count,
-        metrics.excessive_small_pack_count,
-        metrics.small_pack_count,
-        metrics.distinct_sizes,
-        metrics.overage,
-        tuple(-value for value in metrics.larger_pack_bias),
-    )
+_SortKey = tuple[int, int, int, int, int, int, tuple[int, ...]]
 
 
-def _build_metrics(
+def _candidate_sort_key(
     *,
-    selection: list[PackageSelection],
-    overage: Decimal,
-    smallest_size: Decimal,
-) -> _SuggestionMetrics:
+    counts: tuple[int, ...],
+    sizes: list[int],
+    overage: int,
+    scale: int,
+) -> _SortKey:
     """
-    Build deterministic optimization metrics for package suggestions.
+    Build the deterministic optimization key for a package count vector.
+
+    Amounts are fixed-point integers (real value times ``scale``). ``sizes`` is
+    sorted ascending, so ``counts[0]`` holds the smallest packs.
 
     Priority model:
     1) Required amount is already guaranteed by caller.
@@ -66,27 +50,26 @@ def _build_metrics(
     5) Overage is tolerated when it simplifies the order.
     """
 
-    pack_count = sum(item.count for item in selection)
-    small_pack_count = sum(item.count for item in selection if item.size_value == smallest_size)
+    pack_count = sum(counts)
+    small_pack_count = counts[0]
     excessive_small_pack_count = max(0, small_pack_count - 2)
-    distinct_sizes = len(selection)
-
-    weighted_score = (
-        overage
-        + Decimal(pack_count * 4)
-        + Decimal(small_pack_count * 2)
-        + Decimal(excessive_small_pack_count * 5)
-        + Decimal(distinct_sizes)
+    distinct_sizes = sum(1 for count in counts if count > 0)
+
+    weighted_score = overage + scale * (
+        pack_count * 4
+        + small_pack_count * 2
+        + excessive_small_pack_count * 5
+        + distinct_sizes
     )
-    larger_pack_bias = tuple(sorted((item.size_value for item in selection), reverse=True))
-    return _SuggestionMetrics(
-        weighted_score=weighted_score,
-        pack_count=pack_count,
-        excessive_small_pack_count=excessive_small_pack_count,
-        small_pack_count=small_pack_count,
-        distinct_sizes=distinct_sizes,
-        overage=overage,
-        larger_pack_bias=larger_pack_bias,
+    larger_pack_bias = tuple(-sizes[i] for i in reversed(range(len(sizes))) if counts[i] > 0)
+    return (
+        weighted_score,
+        pack_count,
+        excessive_small_pack_count,
+        small_pack_count,
+        distinct_sizes,
+        overage,
+        larger_pack_bias,
     )
 
 
@@ -106,39 +89,64 @@ def _normalize_packages(packages: Iterable[PackageOption], unit: str) -> list[Pa
     return normalized
 
 
-def _count_vectors(total_count: int, dimension_count: int) -> Iterable[list[int]]:
-    """Yield every non-negative integer vector of the given length summing to total_count."""
-    current = [0] * dimension_count
+def _candidates_for_pack_count(
+    pack_count: int,
+    sizes: list[int],
+    required_amount: int,
+    scale: int,
+    score_limit: int | None = None,
+) -> Iterable[tuple[tuple[int, ...], int]]:
+    """Yield (counts, total) for every selection of exactly pack_count packs that
+    meets the required amount. Amounts are fixed-point integers scaled by ``scale``.
+
+    Branches are pruned when even filling the remaining packs with the largest size
+    cannot reach the required amount, or when the smallest reachable overage already
+    pushes the weighted score above ``score_limit``.
+    """
+    dimension_count = len(sizes)
+    largest_size = sizes[-1]
+    pack_count_score = pack_count * 4 * scale
+    counts = [0] * dimension_count
 
-    def build(index: int, remaining: int) -> Iterable[list[int]]:
+    def build(index: int, remaining: int, partial_total: int) -> Iterable[tuple[tuple[int, ...], int]]:
+        if partial_total + largest_size * remaining < required_amount:
+            return
+        if score_limit is not None:
+            lowest_total = partial_total + sizes[index] * remaining
+            if lowest_total - required_amount + pack_count_score > score_limit:
+                return
         if index == dimension_count - 1:
-            current[index] = remaining
-            yield current.copy()
+            counts[index] = remaining
+            yield tuple(counts), partial_total + sizes[index] * remaining
             return
         for count in range(remaining + 1):
-            current[index] = count
-            yield from build(index + 1, remaining - count)
+            counts[index] = count
+            yield from build(index + 1, remaining - count, partial_total + sizes[index] * count)
 
-    yield from build(0, total_count)
+    yield from build(0, pack_count, 0)
 
 
-def _candidates_for_pack_count(
-    pack_count: int,
+def _decimal_places(value: Decimal) -> int:
+    exponent = value.as_tuple().exponent
+    return max(0, -exponent) if isinstance(exponent, int) else 0
+
+
+def _build_suggestion(
+    counts: tuple[int, ...],
     normalized: list[PackageOption],
     required_amount: Decimal,
-) -> Iterable[tuple[SeedPackageSuggestion, Decimal]]:
-    """Yield (suggestion, overage) for every selection of exactly pack_count packs
-    that meets the required amount."""
-    for counts in _count_vectors(pack_count, len(normalized)):
-        total = sum((normalized[i].size_value * Decimal(counts[i]) for i in range(len(normalized))), Decimal('0'))
-        if total < required_amount:
-            continue
-        overage = total - required_amount
-        selection = [
-            PackageSelection(size_value=normalized[i].size_value, size_unit=normalized[i].size_unit, count=counts[i])
-            for i in range(len(normalized)) if counts[i] > 0
-        ]
-        yield SeedPackageSuggestion(selection=selection, total_amount=total, overage=overage, pack_count=pack_count), overage
+) -> SeedPackageSuggestion:
+    total = sum((package.size_value * count for package, count in zip(normalized, counts, strict=True)), Decimal('0'))
+    selection = [
+        PackageSelection(size_value=package.size_value, size_unit=package.size_unit, count=count)
+        for package, count in zip(normalized, counts, strict=True) if count > 0
+    ]
+    return SeedPackageSuggestion(
+        selection=selection,
+        total_amount=total,
+        overage=total - required_amount,
+        pack_count=sum(counts),
+    )
 
 
 def compute_seed_package_suggestion(required_amount: Decimal, packages: Iterable[PackageOption], unit: str) -> SeedPackageSuggestion:
@@ -152,20 +160,27 @@ def compute_seed_package_suggestion(required_amount: Decimal, packages: Iterable
     min_pack_count = int((required_amount / normalized[-1].size_value).to_integral_value(rounding=ROUND_CEILING))
     max_pack_count = int((required_amount / normalized[0].size_value).to_integral_value(rounding=ROUND_CEILING)) + 2
 
-    smallest_size = normalized[0].size_value
-    best: SeedPackageSuggestion | None = None
-    best_metrics: _SuggestionMetrics | None = None
+    # Search on fixed-point integers; Decimal arithmetic dominates the enumeration otherwise.
+    places = max(_decimal_places(value) for value in [required_amount, *(p.size_value for p in normalized)])
+    scale = 10 ** places
+    sizes = [int(package.size_value.scaleb(places)) for package in normalized]
+    required = int(required_amount.scaleb(places))
+    best: tuple[int, ...] | None = None
+    best_key: _SortKey | None = None
 
     for pack_count in range(max(1, min_pack_count), max_pack_count + 1):
-        for candidate, overage in _candidates_for_pack_count(pack_count, normalized, required_amount):
-            metrics = _build_metrics(selection=candidate.selection, overage=overage, smallest_size=smallest_size)
-            if best_metrics is None or _metrics_sort_key(metrics) < _metrics_sort_key(best_metrics):
-                best = candidate
-                best_metrics = metrics
-
-        if best_metrics is not None:
-            lower_bound_next_pack_count = Decimal((pack_count + 1) * 4 + 1)
-            if lower_bound_next_pack_count > best_metrics.weighted_score:
+        score_limit = best_key[0] if best_key is not None else None
+        for counts, total in _candidates_for_pack_count(pack_count, sizes, required, scale, score_limit):
+            key = _candidate_sort_key(counts=counts, sizes=sizes, overage=total - required, scale=scale)
+            if best_key is None or key < best_key:
+                best = counts
+                best_key = key
+
+        if best_key is not None:
+            lower_bound_next_pack_count = ((pack_count + 1) * 4 + 1) * scale
+            if lower_bound_next_pack_count > best_key[0]:
                 break
 
-    return best or _empty_suggestion()
+    if best is None:
+        return _empty_suggestion()
+    return _build_suggestion(best, normalized, required_amount)
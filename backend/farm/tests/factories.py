@@ -0,0 +1,18 @@
+"""Shared model factories for the farm test modules."""
+
+from farm.models import Bed, Field, Location, Project
+
+
+def make_farm(
+    project: Project,
+    *,
+    location_name: str = 'Test Location',
+    field_name: str = 'Test Field',
+    bed_name: str = 'Test Bed',
+    bed_area_sqm: float | None = None,
+) -> tuple[Location, Field, Bed]:
+    """Create the default location -> field -> bed chain for a project."""
+    location = Location.objects.create(name=location_name, project=project)
+    field = Field.objects.create(name=field_name, location=location, project=project)
+    bed = Bed.objects.create(name=bed_name, field=field, area_sqm=bed_area_sqm, project=project)
+    return location, field, bed
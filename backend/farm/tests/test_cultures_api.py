@@ -28,12 +28,12 @@ class CultureApiTest(ProjectApiTestCase):
             'supplier_name': self.supplier.name,
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/cultures/', data, format='json')
+        response = self.client.post(self.cultures_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['supplier']['id'], self.supplier.id)
 
     def test_culture_list(self):
-        response = self.client.get('/openfarmplanner/api/cultures/')
+        response = self.client.get(self.cultures_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
 
@@ -52,7 +52,7 @@ class CultureApiTest(ProjectApiTestCase):
             )
 
         with self.assertNumQueries(8):
-            response = self.client.get('/openfarmplanner/api/cultures/')
+            response = self.client.get(self.cultures_url)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 6)
 
@@ -90,7 +90,7 @@ class CultureApiTest(ProjectApiTestCase):
             'harvest_method': 'per_plant',
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/cultures/', data)
+        response = self.client.post(self.cultures_url, data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Culture.objects.count(), 2)
         # Check that display color was auto-generated
@@ -103,7 +103,7 @@ class CultureApiTest(ProjectApiTestCase):
             'variety': 'Different Variety',
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/cultures/', data, format='json')
+        response = self.client.post(self.cultures_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
 
     def test_culture_create_rejects_duplicate_name_and_variety(self):
@@ -117,7 +117,7 @@ class CultureApiTest(ProjectApiTestCase):
             'variety': existing.variety,
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/cultures/', data, format='json')
+        response = self.client.post(self.cultures_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('name', response.data)
 
@@ -132,7 +132,7 @@ class CultureApiTest(ProjectApiTestCase):
             'variety': f"  {existing.variety.upper()}  ",
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/cultures/', data, format='json')
+        response = self.client.post(self.cultures_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('name', response.data)
 
@@ -226,7 +226,7 @@ class CultureApiTest(ProjectApiTestCase):
             'display_color': '#FF5733',
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/cultures/', data, format='json')
+        response = self.client.post(self.cultures_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(response.data['name'], 'Comprehensive Culture')
         self.assertEqual(response.data['crop_family'], 'Solanaceae')
@@ -242,7 +242,7 @@ class CultureApiTest(ProjectApiTestCase):
             'supplier_name': self.supplier.name,
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/cultures/', data)
+        response = self.client.post(self.cultures_url, data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIsNone(response.data['growth_duration_days'])
         self.assertIsNone(response.data['harvest_duration_days'])
@@ -257,7 +257,7 @@ class CultureApiTest(ProjectApiTestCase):
             'display_color': 'invalid',  # Not hex format
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/cultures/', data)
+        response = self.client.post(self.cultures_url, data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('display_color', response.data)
 
@@ -650,6 +650,6 @@ class CultureApiTest(ProjectApiTestCase):
             'harvest_method': 'per_plant',
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/cultures/', data, format='json')
+        response = self.client.post(self.cultures_url, data, format='json')
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('supplier_product_url', response.data)
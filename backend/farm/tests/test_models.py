@@ -1,18 +1,39 @@
 from datetime import date, timedelta
+from decimal import Decimal
+from functools import cache
 
-from django.test import TestCase
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.test import SimpleTestCase, TestCase
 from django.utils import timezone
 
 from django.contrib.auth import get_user_model
 
 from accounts.models import PublicProfile
 from farm.models import Bed, Culture, Field, Location, PlantingPlan, Project, PublicCulture, Supplier, Task, is_supplier_domain
+from farm.tests.factories import make_farm
 
 User = get_user_model()
 
+PLANTING_DATE = date(2024, 3, 1)
+HARVEST_70 = PLANTING_DATE + timedelta(days=70)
+HARVEST_90 = PLANTING_DATE + timedelta(days=90)
+
+
+@cache
+def _other_field_names(model: type[models.Model], field_name: str) -> frozenset[str]:
+    return frozenset(field.name for field in model._meta.get_fields() if field.name != field_name)
+
+
+def clean_field(instance: models.Model, field_name: str) -> None:
+    """Run full_clean() for one field, skipping validators of all other fields."""
+    instance.full_clean(exclude=_other_field_names(type(instance), field_name))
+
+
 class SupplierModelTest(TestCase):
-    def setUp(self):
-        self.project = Project.objects.create(name='Supplier Test Project', slug='supplier-test-project')
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(name='Supplier Test Project', slug='supplier-test-project')
 
     def _create_supplier(self, **kwargs) -> Supplier:
         defaults = {'project': self.project}
@@ -70,18 +91,14 @@ class SupplierModelTest(TestCase):
         self.assertTrue(is_supplier_domain('https://shop.reinsaat.at/product', supplier))
         self.assertFalse(is_supplier_domain('https://other.example/product', supplier))
 
-class LocationModelTest(TestCase):
-    def setUp(self):
-        self.project = Project.objects.create(name='Location Test Project', slug='location-test-project')
-
+class LocationModelTest(SimpleTestCase):
     def test_location_creation(self):
-        location = Location.objects.create(
+        location = Location(
             name="Main Farm",
             address="123 Farm Road",
             description="Acker hinter Hof",
             soil_type=Location.SOIL_TYPE_LOAM,
             exposure=Location.EXPOSURE_SOUTH,
-            project=self.project,
         )
         self.assertEqual(str(location), "Main Farm")
         self.assertEqual(location.name, "Main Farm")
@@ -90,9 +107,10 @@ class LocationModelTest(TestCase):
 
 
 class FieldModelTest(TestCase):
-    def setUp(self):
-        self.project = Project.objects.create(name='Field Test Project', slug='field-test-project')
-        self.location = Location.objects.create(name="Test Location", project=self.project)
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(name='Field Test Project', slug='field-test-project')
+        cls.location = Location.objects.create(name="Test Location", project=cls.project)
 
     def test_field_creation(self):
         field = Field.objects.create(
@@ -103,53 +121,39 @@ class FieldModelTest(TestCase):
         )
         self.assertEqual(str(field), "Test Location - North Field")
     
-    def test_field_area_validation_too_small(self):
-        from django.core.exceptions import ValidationError
-        field = Field(
-            name="Tiny Field",
-            location=self.location,
-            area_sqm=0.001  # Less than MIN_AREA_SQM (0.01)
-        )
-        with self.assertRaises(ValidationError) as cm:
-            field.full_clean()
-        self.assertIn('area_sqm', cm.exception.message_dict)
-    
-    def test_field_area_validation_too_large(self):
-        from django.core.exceptions import ValidationError
-        field = Field(
-            name="Huge Field",
-            location=self.location,
-            area_sqm=2000000  # Greater than MAX_AREA_SQM (1,000,000)
-        )
-        with self.assertRaises(ValidationError) as cm:
-            field.full_clean()
-        self.assertIn('area_sqm', cm.exception.message_dict)
-    
-    def test_field_area_validation_valid_range(self):
-        # Test minimum valid value
-        field_min = Field.objects.create(
-            name="Min Field",
-            location=self.location,
-            area_sqm=0.01,
-            project=self.project,
-        )
-        self.assertEqual(field_min.area_sqm, 0.01)
-        
-        # Test a large valid value (max_digits=10, decimal_places=2 means max 8 digits before decimal)
-        field_large = Field.objects.create(
-            name="Large Field",
-            location=self.location,
-            area_sqm=12345678.90,
-            project=self.project,
-        )
-        self.assertEqual(field_large.area_sqm, 12345678.90)
+    def test_field_area_validation(self):
+        # (area, rejected): one decimal place, up to MAX_AREA_SQM (1,000,000)
+        cases = (
+            (Decimal('0.001'), True),
+            (Decimal('2000000'), True),
+            (Decimal('0.1'), False),
+            (Decimal('1000000'), False),
+        )
+        for area_sqm, rejected in cases:
+            with self.subTest(area_sqm=area_sqm):
+                field = Field(
+                    name=f"Area Field {area_sqm}",
+                    location=self.location,
+                    area_sqm=area_sqm,
+                    project=self.project,
+                )
+                if rejected:
+                    with self.assertRaises(ValidationError) as cm:
+                        clean_field(field, 'area_sqm')
+                    self.assertIn('area_sqm', cm.exception.message_dict)
+                else:
+                    clean_field(field, 'area_sqm')
+                    field.save()
+                    field.refresh_from_db()
+                    self.assertEqual(field.area_sqm, area_sqm)
 
 
 class BedModelTest(TestCase):
-    def setUp(self):
-        self.project = Project.objects.create(name='Bed Test Project', slug='bed-test-project')
-        self.location = Location.objects.create(name="Test Location", project=self.project)
-        self.field = Field.objects.create(name="Test Field", location=self.location, project=self.project)
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(name='Bed Test Project', slug='bed-test-project')
+        cls.location = Location.objects.create(name="Test Location", project=cls.project)
+        cls.field = Field.objects.create(name="Test Field", location=cls.location, project=cls.project)
 
     def test_bed_creation(self):
         bed = Bed.objects.create(
@@ -160,89 +164,106 @@ class BedModelTest(TestCase):
         )
         self.assertEqual(str(bed), "Test Field - Bed A")
     
-    def test_bed_area_validation_too_small(self):
-        from django.core.exceptions import ValidationError
-        bed = Bed(
-            name="Tiny Bed",
-            field=self.field,
-            area_sqm=0.001  # Less than MIN_AREA_SQM (0.01)
-        )
-        with self.assertRaises(ValidationError):
-            bed.full_clean()
-    
-    def test_bed_area_validation_too_large(self):
-        from django.core.exceptions import ValidationError
-        bed = Bed(
-            name="Huge Bed",
-            field=self.field,
-            area_sqm=20000  # Greater than MAX_AREA_SQM (10,000)
-        )
-        with self.assertRaises(ValidationError):
-            bed.full_clean()
-    
-    def test_bed_area_validation_valid_range(self):
-        # Test minimum valid value
-        bed_min = Bed.objects.create(
-            name="Min Bed",
-            field=self.field,
-            area_sqm=0.01,
-            project=self.project,
-        )
-        self.assertEqual(bed_min.area_sqm, 0.01)
-        
-        # Test a large valid value within MAX_AREA_SQM
-        bed_large = Bed.objects.create(
-            name="Large Bed",
-            field=self.field,
-            area_sqm=9999.99,
-            project=self.project,
-        )
-        self.assertEqual(bed_large.area_sqm, 9999.99)
-
-    def test_bed_get_total_area(self):
-        bed = Bed.objects.create(
-            name="Bed B",
-            field=self.field,
-            area_sqm=15.0,
-            project=self.project,
-        )
-        self.assertEqual(bed.get_total_area(), 15.0)
-
-    def test_bed_get_total_area_no_dimensions(self):
-        bed = Bed.objects.create(
-            name="Bed C",
-            field=self.field,
-            project=self.project,
-        )
-        self.assertIsNone(bed.get_total_area())
-
-
-
-
-class CultureModelTest(TestCase):
-    def setUp(self):
-        self.project = Project.objects.create(name='Culture Test Project', slug='culture-test-project')
+    def test_bed_area_validation(self):
+        # (area, rejected): one decimal place, up to MAX_AREA_SQM (10,000)
+        cases = (
+            (Decimal('0.001'), True),
+            (Decimal('20000'), True),
+            (Decimal('0.1'), False),
+            (Decimal('10000'), False),
+        )
+        for area_sqm, rejected in cases:
+            with self.subTest(area_sqm=area_sqm):
+                bed = Bed(
+                    name=f"Area Bed {area_sqm}",
+                    field=self.field,
+                    area_sqm=area_sqm,
+                    project=self.project,
+                )
+                if rejected:
+                    with self.assertRaises(ValidationError) as cm:
+                        clean_field(bed, 'area_sqm')
+                    self.assertIn('area_sqm', cm.exception.message_dict)
+                else:
+                    clean_field(bed, 'area_sqm')
+                    bed.save()
+                    bed.refresh_from_db()
+                    self.assertEqual(bed.area_sqm, area_sqm)
+
+
+class CultureInMemoryTest(SimpleTestCase):
+    """Culture behaviour that needs no database: __str__ and clean()."""
 
     def test_culture_creation_with_variety(self):
-        culture = Culture.objects.create(
+        culture = Culture(
             name="Tomato",
             variety="Cherry",
             growth_duration_days=8,
             harvest_duration_days=4,
-            project=self.project,
         )
         self.assertEqual(str(culture), "Tomato (Cherry)")
     
     def test_culture_creation_without_variety(self):
         """Test creating a culture without a variety"""
-        culture = Culture.objects.create(
+        culture = Culture(
             name="Lettuce",
             growth_duration_days=4,
             harvest_duration_days=2,
-            project=self.project,
         )
         self.assertEqual(str(culture), "Lettuce")
+
+    def test_negative_numeric_fields_validation(self):
+        """Test that negative values for numeric fields are rejected"""
+        culture = Culture(
+            name="Lettuce",
+            growth_duration_days=-1,
+            harvest_duration_days=2
+        )
+        with self.assertRaises(ValidationError) as context:
+            culture.clean()
+        self.assertIn('growth_duration_days', context.exception.message_dict)
+
     
+    def test_display_color_format_validation(self):
+        """Test that display color must be in hex format"""
+        # Invalid color format
+        culture = Culture(
+            name="Tomato",
+            growth_duration_days=8,
+            harvest_duration_days=4,
+            display_color="invalid"
+        )
+        with self.assertRaises(ValidationError) as context:
+            culture.clean()
+        self.assertIn('display_color', context.exception.message_dict)
+        
+        # Valid color format
+        culture2 = Culture(
+            name="Tomato",
+            growth_duration_days=8,
+            harvest_duration_days=4,
+            harvest_method='per_sqm',
+            display_color="#FF5733"
+        )
+        culture2.clean()  # Should not raise
+
+
+    def test_harvest_duration_does_not_require_harvest_method(self):
+        culture = Culture(
+            name='Kohl',
+            variety='Türkis',
+            growth_duration_days=90,
+            harvest_duration_days=21,
+        )
+
+        culture.clean()
+
+
+class CultureModelTest(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(name='Culture Test Project', slug='culture-test-project')
+
     def test_culture_with_manual_planning_fields(self):
         """Test creating a culture with all manual planning fields"""
         culture = Culture.objects.create(
@@ -315,100 +336,41 @@ class CultureModelTest(TestCase):
         
         # All colors should be unique
         self.assertEqual(len(colors), 10)
-    
-    def test_negative_numeric_fields_validation(self):
-        """Test that negative values for numeric fields are rejected"""
-        from django.core.exceptions import ValidationError
-        
-        culture = Culture(
-            name="Lettuce",
-            growth_duration_days=-1,
-            harvest_duration_days=2
-        )
-        with self.assertRaises(ValidationError) as context:
-            culture.clean()
-        self.assertIn('growth_duration_days', context.exception.message_dict)
-
-    
-    def test_display_color_format_validation(self):
-        """Test that display color must be in hex format"""
-        from django.core.exceptions import ValidationError
-        
-        # Invalid color format
-        culture = Culture(
-            name="Tomato",
-            growth_duration_days=8,
-            harvest_duration_days=4,
-            display_color="invalid"
-        )
-        with self.assertRaises(ValidationError) as context:
-            culture.clean()
-        self.assertIn('display_color', context.exception.message_dict)
-        
-        # Valid color format
-        culture2 = Culture(
-            name="Tomato",
-            growth_duration_days=8,
-            harvest_duration_days=4,
-            harvest_method='per_sqm',
-            display_color="#FF5733"
-        )
-        culture2.clean()  # Should not raise
-
-
-    def test_harvest_duration_does_not_require_harvest_method(self):
-        culture = Culture(
-            name='Kohl',
-            variety='Türkis',
-            growth_duration_days=90,
-            harvest_duration_days=21,
-        )
-
-        culture.clean()
-
 
 
 class PlantingPlanModelTest(TestCase):
-    def setUp(self):
-        self.project = Project.objects.create(name='Planting Plan Test Project', slug='planting-plan-test-project')
-        self.location = Location.objects.create(name="Test Location", project=self.project)
-        self.field = Field.objects.create(name="Test Field", location=self.location, project=self.project)
-        self.bed = Bed.objects.create(
-            name="Test Bed",
-            field=self.field,
-            area_sqm=20.0,  # Total area: 20 sqm
-            project=self.project,
-        )
-        self.culture = Culture.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(name='Planting Plan Test Project', slug='planting-plan-test-project')
+        cls.location, cls.field, cls.bed = make_farm(cls.project, bed_area_sqm=20.0)  # Total area: 20 sqm
+        cls.culture = Culture.objects.create(
             name="Carrot",
             growth_duration_days=70,
             harvest_duration_days=3,
-            project=self.project,
+            project=cls.project,
         )
 
     def test_auto_harvest_date(self):
-        planting_date = date(2024, 3, 1)
         plan = PlantingPlan.objects.create(
             culture=self.culture,
             bed=self.bed,
-            planting_date=planting_date,
+            planting_date=PLANTING_DATE,
             quantity=100,
             project=self.project,
         )
-        expected_harvest = planting_date + timedelta(days=70)
+        expected_harvest = HARVEST_70
         self.assertEqual(plan.harvest_date, expected_harvest)
 
     def test_harvest_date_recalculates_when_planting_date_changes(self):
         """Test that harvest dates recalculate when planting_date changes"""
-        planting_date = date(2024, 3, 1)
         plan = PlantingPlan.objects.create(
             culture=self.culture,
             bed=self.bed,
-            planting_date=planting_date,
+            planting_date=PLANTING_DATE,
             quantity=100,
             project=self.project,
         )
-        expected_harvest = planting_date + timedelta(days=70)
+        expected_harvest = HARVEST_70
         self.assertEqual(plan.harvest_date, expected_harvest)
         
         # Change planting date
@@ -422,15 +384,14 @@ class PlantingPlanModelTest(TestCase):
     
     def test_harvest_date_recalculates_when_culture_changes(self):
         """Test that harvest dates recalculate when culture changes"""
-        planting_date = date(2024, 3, 1)
         plan = PlantingPlan.objects.create(
             culture=self.culture,
             bed=self.bed,
-            planting_date=planting_date,
+            planting_date=PLANTING_DATE,
             quantity=100,
             project=self.project,
         )
-        expected_harvest = planting_date + timedelta(days=70)
+        expected_harvest = HARVEST_70
         self.assertEqual(plan.harvest_date, expected_harvest)
         
         # Create new culture with different harvest days
@@ -444,15 +405,14 @@ class PlantingPlanModelTest(TestCase):
         plan.save()
         
         # Harvest date should recalculate with new culture's timing
-        new_expected_harvest = planting_date + timedelta(days=90)
+        new_expected_harvest = HARVEST_90
         self.assertEqual(plan.harvest_date, new_expected_harvest)
 
     def test_harvest_dates_recalculate_when_culture_timing_changes(self):
-        planting_date = date(2024, 3, 1)
         plan = PlantingPlan.objects.create(
             culture=self.culture,
             bed=self.bed,
-            planting_date=planting_date,
+            planting_date=PLANTING_DATE,
             quantity=100,
             project=self.project,
         )
@@ -462,7 +422,7 @@ class PlantingPlanModelTest(TestCase):
         self.culture.save(update_fields=['growth_duration_days', 'harvest_duration_days'])
 
         plan.refresh_from_db()
-        expected_harvest_start = planting_date + timedelta(days=80)
+        expected_harvest_start = PLANTING_DATE + timedelta(days=80)
         self.assertEqual(plan.harvest_date, expected_harvest_start)
         self.assertEqual(plan.harvest_end_date, expected_harvest_start + timedelta(days=5))
     
@@ -474,16 +434,15 @@ class PlantingPlanModelTest(TestCase):
             harvest_duration_days=25,
             project=self.project,
         )
-        planting_date = date(2024, 3, 1)
         plan = PlantingPlan.objects.create(
             culture=culture_with_median,
             bed=self.bed,
-            planting_date=planting_date,
+            planting_date=PLANTING_DATE,
             quantity=100,
             project=self.project,
         )
         
-        expected_harvest_start = planting_date + timedelta(days=65)
+        expected_harvest_start = PLANTING_DATE + timedelta(days=65)
         self.assertEqual(plan.harvest_date, expected_harvest_start)
         
         expected_harvest_end = expected_harvest_start + timedelta(days=25)
@@ -491,11 +450,10 @@ class PlantingPlanModelTest(TestCase):
     
     def test_harvest_end_date_defaults_to_harvest_date(self):
         """Test harvest_end_date calculation when both culture durations exist."""
-        planting_date = date(2024, 3, 1)
         plan = PlantingPlan.objects.create(
             culture=self.culture,
             bed=self.bed,
-            planting_date=planting_date,
+            planting_date=PLANTING_DATE,
             quantity=100,
             project=self.project,
         )
@@ -507,16 +465,15 @@ class PlantingPlanModelTest(TestCase):
             name="Unknown timing",
             project=self.project,
         )
-        planting_date = date(2024, 3, 1)
         plan = PlantingPlan.objects.create(
             culture=culture_without_timing,
             bed=self.bed,
-            planting_date=planting_date,
+            planting_date=PLANTING_DATE,
             quantity=100,
             project=self.project,
         )
 
-        self.assertEqual(plan.planting_date, planting_date)
+        self.assertEqual(plan.planting_date, PLANTING_DATE)
         self.assertIsNone(plan.harvest_date)
         self.assertIsNone(plan.harvest_end_date)
         self.assertIsNone(plan._get_active_period())
@@ -527,16 +484,15 @@ class PlantingPlanModelTest(TestCase):
             growth_duration_days=30,
             project=self.project,
         )
-        planting_date = date(2024, 3, 1)
         plan = PlantingPlan.objects.create(
             culture=culture_without_harvest_duration,
             bed=self.bed,
-            planting_date=planting_date,
+            planting_date=PLANTING_DATE,
             quantity=100,
             project=self.project,
         )
 
-        self.assertEqual(plan.harvest_date, planting_date + timedelta(days=30))
+        self.assertEqual(plan.harvest_date, PLANTING_DATE + timedelta(days=30))
         self.assertIsNone(plan.harvest_end_date)
         self.assertIsNone(plan._get_active_period())
 
@@ -547,47 +503,39 @@ class PlantingPlanModelTest(TestCase):
             harvest_duration_days=0,
             project=self.project,
         )
-        planting_date = date(2024, 3, 1)
         plan = PlantingPlan.objects.create(
             culture=culture_with_zero_timing,
             bed=self.bed,
-            planting_date=planting_date,
+            planting_date=PLANTING_DATE,
             quantity=100,
             project=self.project,
         )
 
-        self.assertEqual(plan.harvest_date, planting_date)
-        self.assertEqual(plan.harvest_end_date, planting_date)
-        self.assertEqual(plan._get_active_period(), (planting_date, planting_date))
+        self.assertEqual(plan.harvest_date, PLANTING_DATE)
+        self.assertEqual(plan.harvest_end_date, PLANTING_DATE)
+        self.assertEqual(plan._get_active_period(), (PLANTING_DATE, PLANTING_DATE))
 
     def test_area_usage_no_bed_dimensions(self):
         """Test that validation is skipped when bed has no dimensions"""
-        from django.core.exceptions import ValidationError
-        
-        bed_no_dims = Bed.objects.create(name="No Dims Bed", field=self.field, project=self.project)
+        bed_no_dims = Bed(name="No Dims Bed", field=self.field, project=self.project)
         plan = PlantingPlan(
             culture=self.culture,
             bed=bed_no_dims,
-            planting_date=date(2024, 3, 1),
+            planting_date=PLANTING_DATE,
             area_usage_sqm=100.0,  # Large value, but should be allowed
             project=self.project,
         )
         # Should not raise ValidationError since bed has no dimensions
         plan.clean()
-        plan.save()
 
 
 
-class TaskModelTest(TestCase):
-    def setUp(self):
-        self.project = Project.objects.create(name='Task Test Project', slug='task-test-project')
-
+class TaskModelTest(SimpleTestCase):
     def test_task_creation(self):
-        task = Task.objects.create(
+        task = Task(
             title="Water plants",
             description="Water all beds in field A",
             status="pending",
-            project=self.project,
         )
         self.assertEqual(str(task), "Water plants (pending)")
         self.assertEqual(task.status, "pending")
@@ -636,8 +584,9 @@ class PublicCultureAttributionTest(TestCase):
 
 class CultureNormalizedFieldsTest(TestCase):
     """Tests for Culture model normalized fields."""
-    def setUp(self):
-        self.project = Project.objects.create(name='Culture Normalization Project', slug='culture-normalization-project')
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(name='Culture Normalization Project', slug='culture-normalization-project')
     
     def test_culture_normalized_fields_populated(self):
         """Test that normalized fields are populated on save."""
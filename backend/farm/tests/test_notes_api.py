@@ -8,15 +8,13 @@ from rest_framework import status
 from rest_framework.test import APITestCase as DRFAPITestCase
 
 from farm.models import (
-    Bed,
     Culture,
-    Field,
-    Location,
     PlantingPlan,
     Project,
     ProjectMembership,
 )
 from farm.tests.api_base import ProjectApiTestCase, User
+from farm.tests.factories import make_farm
 
 
 class MediaUploadApiTest(ProjectApiTestCase):
@@ -81,28 +79,34 @@ class MediaUploadApiTest(ProjectApiTestCase):
 
 
 class NoteAttachmentApiTest(DRFAPITestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(username='attachapiuser', email='attachapi@example.com', password='testpass', is_active=True)
-        self.project = Project.objects.create(name='Attachment API Project', slug='attachment-api-project')
-        ProjectMembership.objects.create(user=self.user, project=self.project, role='admin')
-        self.client.force_authenticate(user=self.user)
-        self.client.defaults['HTTP_X_PROJECT_ID'] = str(self.project.id)
-        self.location = Location.objects.create(name="Attachment Location", project=self.project)
-        self.field = Field.objects.create(name="Attachment Field", location=self.location, project=self.project)
-        self.bed = Bed.objects.create(name="Attachment Bed", field=self.field, project=self.project)
-        self.culture = Culture.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='attachapiuser', email='attachapi@example.com', password='testpass', is_active=True)
+        cls.project = Project.objects.create(name='Attachment API Project', slug='attachment-api-project')
+        ProjectMembership.objects.create(user=cls.user, project=cls.project, role='admin')
+        cls.location, cls.field, cls.bed = make_farm(
+            cls.project,
+            location_name="Attachment Location",
+            field_name="Attachment Field",
+            bed_name="Attachment Bed",
+        )
+        cls.culture = Culture.objects.create(
             name="Attachment Culture",
             growth_duration_days=7,
             harvest_duration_days=2,
-            project=self.project,
+            project=cls.project,
         )
-        self.plan = PlantingPlan.objects.create(
-            culture=self.culture,
-            bed=self.bed,
+        cls.plan = PlantingPlan.objects.create(
+            culture=cls.culture,
+            bed=cls.bed,
             planting_date=date(2024, 3, 1),
-            project=self.project,
+            project=cls.project,
         )
 
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+        self.client.defaults['HTTP_X_PROJECT_ID'] = str(self.project.id)
+
     @patch('farm.notes.views.process_note_image')
     def test_upload_list_delete_attachment(self, mock_process):
         mock_process.return_value = (
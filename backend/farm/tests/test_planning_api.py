@@ -1,8 +1,13 @@
 """API tests for planting plans and area validation."""
 
 from datetime import date
+from decimal import Decimal
+from importlib import import_module
 
+from django.conf import settings
+from django.urls import reverse
 from rest_framework import status
+from rest_framework.test import APIRequestFactory, force_authenticate
 from rest_framework.test import APITestCase as DRFAPITestCase
 
 from farm.models import (
@@ -15,25 +20,57 @@ from farm.models import (
     Project,
     ProjectMembership,
 )
+from farm.planning.views import PlantingPlanViewSet
+from farm.project_context import PROJECT_HEADER
+from farm.services_area import calculate_remaining_bed_area
 from farm.tests.api_base import ProjectApiTestCase, User
+from farm.tests.factories import make_farm
 
 
 class PlantingPlanApiTest(ProjectApiTestCase):
+    request_factory = APIRequestFactory()
+    create_view = staticmethod(PlantingPlanViewSet.as_view({'post': 'create'}))
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # Shared culture/bed part of every create payload; tests add dates and areas.
+        cls.plan_payload = {'culture': cls.culture.id, 'bed': cls.bed.id}
+
+    def _create_plan(self, data: dict):
+        """Dispatch a create request straight to the viewset, skipping middleware and URL routing."""
+        request = self.request_factory.post(
+            self.plans_url, data, format='json', **{PROJECT_HEADER: str(self.project.id)},
+        )
+        # SessionMiddleware is skipped, but project resolution reads the
+        # agent-mode keys from request.session; attach an empty real session.
+        request.session = import_module(settings.SESSION_ENGINE).SessionStore()
+        force_authenticate(request, user=self.user)
+        return self.create_view(request)
+
+    def _seed_plans(self, *plan_kwargs: dict) -> list[PlantingPlan]:
+        """Insert pre-existing plans in one query, bypassing the API."""
+        plans = [
+            PlantingPlan(culture=self.culture, project=self.project, **kwargs)
+            for kwargs in plan_kwargs
+        ]
+        for plan in plans:
+            plan.recalculate_harvest_dates()
+        return PlantingPlan.objects.bulk_create(plans)
+
     def test_planting_plan_create_rejects_bed_from_other_project(self):
         other_project = Project.objects.create(name='Other project 2', slug='other-project-2')
         other_location = Location.objects.create(name='Other location', project=other_project)
         other_field = Field.objects.create(name='Other field', location=other_location, project=other_project)
         other_bed = Bed.objects.create(name='Other bed', field=other_field, area_sqm=5.0, project=other_project)
 
-        response = self.client.post(
-            '/openfarmplanner/api/planting-plans/',
+        response = self._create_plan(
             {
                 'culture': self.culture.id,
                 'bed': other_bed.id,
                 'planting_date': date(2026, 3, 1).isoformat(),
                 'area_usage_sqm': 1.0,
             },
-            format='json',
         )
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
@@ -41,40 +78,31 @@ class PlantingPlanApiTest(ProjectApiTestCase):
 
     def test_planting_plan_create(self):
         data = {
-            'culture': self.culture.id,
-            'bed': self.bed.id,
+            **self.plan_payload,
             'planting_date': '2024-03-01',
             'quantity': 50
         }
-        response = self.client.post('/openfarmplanner/api/planting-plans/', data)
+        response = self._create_plan(data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertIn('harvest_date', response.data)
 
     def test_planting_plan_area_validation_success(self):
         """Test API allows a single planting plan within bed capacity."""
         data = {
-            'culture': self.culture.id,
-            'bed': self.bed.id,
+            **self.plan_payload,
             'planting_date': '2024-03-01',
             'area_usage_sqm': 15.0
         }
-        response = self.client.post('/openfarmplanner/api/planting-plans/', data)
+        response = self._create_plan(data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(float(response.data['area_usage_sqm']), 15.0)
 
     def test_planting_plan_area_validation_non_overlapping_plans_allowed(self):
         """Test API allows non-overlapping plans even when their total sum is above bed capacity."""
-        response1 = self.client.post('/openfarmplanner/api/planting-plans/', {
-            'culture': self.culture.id,
-            'bed': self.bed.id,
-            'planting_date': '2024-03-01',
-            'area_usage_sqm': 20.0,
-        })
-        self.assertEqual(response1.status_code, status.HTTP_201_CREATED)
+        self._seed_plans({'bed': self.bed, 'planting_date': date(2024, 3, 1), 'area_usage_sqm': 20.0})
 
-        response2 = self.client.post('/openfarmplanner/api/planting-plans/', {
-            'culture': self.culture.id,
-            'bed': self.bed.id,
+        response2 = self._create_plan({
+            **self.plan_payload,
             'planting_date': '2024-04-01',
             'area_usage_sqm': 20.0,
         })
@@ -89,15 +117,9 @@ class PlantingPlanApiTest(ProjectApiTestCase):
             project=self.project,
         )
 
-        response1 = self.client.post('/openfarmplanner/api/planting-plans/', {
-            'culture': self.culture.id,
-            'bed': self.bed.id,
-            'planting_date': '2024-03-01',
-            'area_usage_sqm': 15.0,
-        })
-        self.assertEqual(response1.status_code, status.HTTP_201_CREATED)
+        self._seed_plans({'bed': self.bed, 'planting_date': date(2024, 3, 1), 'area_usage_sqm': 15.0})
 
-        response2 = self.client.post('/openfarmplanner/api/planting-plans/', {
+        response2 = self._create_plan({
             'culture': self.culture.id,
             'bed': other_bed.id,
             'planting_date': '2024-03-01',
@@ -107,9 +129,8 @@ class PlantingPlanApiTest(ProjectApiTestCase):
 
     def test_planting_plan_area_validation_update_excludes_current_plan(self):
         """Test API update does not count current plan twice."""
-        create_response = self.client.post('/openfarmplanner/api/planting-plans/', {
-            'culture': self.culture.id,
-            'bed': self.bed.id,
+        create_response = self._create_plan({
+            **self.plan_payload,
             'planting_date': '2024-03-01',
             'area_usage_sqm': 10.0,
         })
@@ -126,17 +147,10 @@ class PlantingPlanApiTest(ProjectApiTestCase):
 
     def test_planting_plan_area_validation_update_partial_rejects_overlap_excess(self):
         """Test partial update allows the new area usage to be saved."""
-        plan_one_response = self.client.post('/openfarmplanner/api/planting-plans/', {
-            'culture': self.culture.id,
-            'bed': self.bed.id,
-            'planting_date': '2024-03-01',
-            'area_usage_sqm': 12.0,
-        })
-        self.assertEqual(plan_one_response.status_code, status.HTTP_201_CREATED)
+        self._seed_plans({'bed': self.bed, 'planting_date': date(2024, 3, 1), 'area_usage_sqm': 12.0})
 
-        plan_two_response = self.client.post('/openfarmplanner/api/planting-plans/', {
-            'culture': self.culture.id,
-            'bed': self.bed.id,
+        plan_two_response = self._create_plan({
+            **self.plan_payload,
             'planting_date': '2024-03-03',
             'area_usage_sqm': 4.0,
         })
@@ -152,17 +166,10 @@ class PlantingPlanApiTest(ProjectApiTestCase):
 
     def test_planting_plan_area_validation_boundary_equal_bed_area_allowed(self):
         """Test API allows overlapping plans whose summed area equals bed capacity."""
-        response1 = self.client.post('/openfarmplanner/api/planting-plans/', {
-            'culture': self.culture.id,
-            'bed': self.bed.id,
-            'planting_date': '2024-03-01',
-            'area_usage_sqm': 12.0,
-        })
-        self.assertEqual(response1.status_code, status.HTTP_201_CREATED)
+        self._seed_plans({'bed': self.bed, 'planting_date': date(2024, 3, 1), 'area_usage_sqm': 12.0})
 
-        response2 = self.client.post('/openfarmplanner/api/planting-plans/', {
-            'culture': self.culture.id,
-            'bed': self.bed.id,
+        response2 = self._create_plan({
+            **self.plan_payload,
             'planting_date': '2024-03-03',
             'area_usage_sqm': 8.0,
         })
@@ -172,45 +179,49 @@ class PlantingPlanApiTest(ProjectApiTestCase):
 class PlantingPlanAreaInputTest(DRFAPITestCase):
     """Test area input as m² or plants for PlantingPlan."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Create test data."""
-        self.user = User.objects.create_user(username='ppuser', email='pp@example.com', password='testpass', is_active=True)
-        self.project = Project.objects.create(name='PP Project', slug='pp-project')
-        ProjectMembership.objects.create(user=self.user, project=self.project, role='admin')
-        self.client.force_authenticate(user=self.user)
-        self.client.defaults['HTTP_X_PROJECT_ID'] = str(self.project.id)
+        cls.plans_url = reverse('plantingplan-list')
+        cls.user = User.objects.create_user(username='ppuser', email='pp@example.com', password='testpass', is_active=True)
+        cls.project = Project.objects.create(name='PP Project', slug='pp-project')
+        ProjectMembership.objects.create(user=cls.user, project=cls.project, role='admin')
         # Create location, field, and bed
-        self.location = Location.objects.create(name="Test Farm", project=self.project)
-        self.field = Field.objects.create(
+        cls.location = Location.objects.create(name="Test Farm", project=cls.project)
+        cls.field = Field.objects.create(
             name="Test Field",
-            location=self.location,
+            location=cls.location,
             area_sqm=100.00,
-            project=self.project,
+            project=cls.project,
         )
-        self.bed = Bed.objects.create(
+        cls.bed = Bed.objects.create(
             name="Test Bed",
-            field=self.field,
+            field=cls.field,
             area_sqm=10.00,
-            project=self.project,
+            project=cls.project,
         )
 
         # Create culture with spacing data
-        self.culture_with_spacing = Culture.objects.create(
+        cls.culture_with_spacing = Culture.objects.create(
             name="Tomato",
             growth_duration_days=60,
             harvest_duration_days=30,
             row_spacing_m=0.50,  # 50 cm
             distance_within_row_m=0.40,  # 40 cm
-            project=self.project,
+            project=cls.project,
         )
 
         # Create culture without spacing data
-        self.culture_no_spacing = Culture.objects.create(
+        cls.culture_no_spacing = Culture.objects.create(
             name="Cucumber",
             growth_duration_days=50,
             harvest_duration_days=20,
-            project=self.project,
+            project=cls.project,
         )
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+        self.client.defaults['HTTP_X_PROJECT_ID'] = str(self.project.id)
     
     def test_plants_per_m2_calculation(self):
         """Test that plants_per_m2 is calculated correctly."""
@@ -232,7 +243,7 @@ class PlantingPlanAreaInputTest(DRFAPITestCase):
             'area_input_unit': 'M2'
         }
         
-        response = self.client.post('/openfarmplanner/api/planting-plans/', data, format='json')
+        response = self.client.post(self.plans_url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(float(response.data['area_usage_sqm']), 2.50)
@@ -248,7 +259,7 @@ class PlantingPlanAreaInputTest(DRFAPITestCase):
             'area_input_unit': 'PLANTS'
         }
         
-        response = self.client.post('/openfarmplanner/api/planting-plans/', data, format='json')
+        response = self.client.post(self.plans_url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         # 10 / 5 = 2.0
@@ -268,7 +279,7 @@ class PlantingPlanAreaInputTest(DRFAPITestCase):
             'area_input_unit': 'PLANTS'
         }
 
-        response = self.client.post('/openfarmplanner/api/planting-plans/', data, format='json')
+        response = self.client.post(self.plans_url, data, format='json')
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('area_input_unit', response.data)
@@ -283,7 +294,7 @@ class PlantingPlanAreaInputTest(DRFAPITestCase):
             'area_input_unit': 'PLANTS'
         }
         
-        response = self.client.post('/openfarmplanner/api/planting-plans/', data, format='json')
+        response = self.client.post(self.plans_url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('area_input_unit', response.data)
@@ -298,7 +309,7 @@ class PlantingPlanAreaInputTest(DRFAPITestCase):
             'area_input_unit': 'M2'
         }
         
-        response = self.client.post('/openfarmplanner/api/planting-plans/', data, format='json')
+        response = self.client.post(self.plans_url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('area_input_value', response.data)
@@ -313,7 +324,7 @@ class PlantingPlanAreaInputTest(DRFAPITestCase):
             # Missing area_input_unit
         }
         
-        response = self.client.post('/openfarmplanner/api/planting-plans/', data, format='json')
+        response = self.client.post(self.plans_url, data, format='json')
         
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('area_input_unit', response.data)
@@ -376,44 +387,37 @@ class PlantingPlanAreaInputTest(DRFAPITestCase):
 class PlantingPlanRemainingAreaApiTest(DRFAPITestCase):
     """Tests for remaining-area endpoint on planting plans."""
 
-    def setUp(self):
-        self.user = User.objects.create_user(username='remaininguser', email='remaining@example.com', password='testpass', is_active=True)
-        self.project = Project.objects.create(name='Remaining Area Project', slug='remaining-area-project')
-        ProjectMembership.objects.create(user=self.user, project=self.project, role='admin')
-        self.client.force_authenticate(user=self.user)
-        self.client.defaults['HTTP_X_PROJECT_ID'] = str(self.project.id)
-        self.location = Location.objects.create(name='Remaining Location', project=self.project)
-        self.field = Field.objects.create(name='Remaining Field', location=self.location, project=self.project)
-        self.bed = Bed.objects.create(name='Remaining Bed', field=self.field, area_sqm=20, project=self.project)
-        self.other_bed = Bed.objects.create(name='Other Bed', field=self.field, area_sqm=15, project=self.project)
-        self.culture = Culture.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='remaininguser', email='remaining@example.com', password='testpass', is_active=True)
+        cls.project = Project.objects.create(name='Remaining Area Project', slug='remaining-area-project')
+        ProjectMembership.objects.create(user=cls.user, project=cls.project, role='admin')
+        cls.location = Location.objects.create(name='Remaining Location', project=cls.project)
+        cls.field = Field.objects.create(name='Remaining Field', location=cls.location, project=cls.project)
+        cls.bed, cls.other_bed = Bed.objects.bulk_create([
+            Bed(name='Remaining Bed', field=cls.field, area_sqm=20, project=cls.project),
+            Bed(name='Other Bed', field=cls.field, area_sqm=15, project=cls.project),
+        ])
+        cls.culture = Culture.objects.create(
             name='Lettuce',
             growth_duration_days=30,
             harvest_duration_days=10,
-            project=self.project,
+            project=cls.project,
         )
 
-        self.plan_one = PlantingPlan.objects.create(
-            culture=self.culture,
-            bed=self.bed,
-            planting_date=date(2024, 3, 1),
-            area_usage_sqm=6,
-            project=self.project,
-        )
-        self.plan_two = PlantingPlan.objects.create(
-            culture=self.culture,
-            bed=self.bed,
-            planting_date=date(2024, 3, 15),
-            area_usage_sqm=4,
-            project=self.project,
-        )
-        PlantingPlan.objects.create(
-            culture=self.culture,
-            bed=self.other_bed,
-            planting_date=date(2024, 3, 10),
-            area_usage_sqm=8,
-            project=self.project,
-        )
+        plans = [
+            PlantingPlan(culture=cls.culture, bed=cls.bed, planting_date=date(2024, 3, 1), area_usage_sqm=6, project=cls.project),
+            PlantingPlan(culture=cls.culture, bed=cls.bed, planting_date=date(2024, 3, 15), area_usage_sqm=4, project=cls.project),
+            PlantingPlan(culture=cls.culture, bed=cls.other_bed, planting_date=date(2024, 3, 10), area_usage_sqm=8, project=cls.project),
+        ]
+        # bulk_create skips save(), so fill in the harvest dates it would derive.
+        for plan in plans:
+            plan.recalculate_harvest_dates()
+        cls.plan_one, cls.plan_two, _ = PlantingPlan.objects.bulk_create(plans)
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+        self.client.defaults['HTTP_X_PROJECT_ID'] = str(self.project.id)
 
     def test_remaining_area_returns_overlap_sum(self):
         response = self.client.get(
@@ -495,49 +499,71 @@ class PlantingPlanRemainingAreaApiTest(DRFAPITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
+    def test_calculate_remaining_bed_area_uses_single_query(self):
+        with self.assertNumQueries(1):
+            remaining = calculate_remaining_bed_area(
+                bed_id=self.bed.id,
+                start_date=date(2024, 3, 20),
+                end_date=date(2024, 4, 10),
+            )
+
+        self.assertEqual(remaining.overlapping_used_area_sqm, Decimal('10'))
+        self.assertEqual(remaining.remaining_area_sqm, Decimal('10'))
+
+    def test_calculate_remaining_bed_area_without_overlap_returns_full_bed(self):
+        remaining = calculate_remaining_bed_area(
+            bed_id=self.bed.id,
+            start_date=date(2025, 1, 1),
+            end_date=date(2025, 1, 31),
+        )
 
-class PlantingPlanAttachmentCountApiTest(DRFAPITestCase):
-    def setUp(self):
-        self.user = User.objects.create_user(username='attachcountuser', email='attachcount@example.com', password='testpass', is_active=True)
-        self.project = Project.objects.create(name='Attach Count Project', slug='attach-count-project')
-        ProjectMembership.objects.create(user=self.user, project=self.project, role='admin')
-        self.client.force_authenticate(user=self.user)
-        self.client.defaults['HTTP_X_PROJECT_ID'] = str(self.project.id)
-        self.location = Location.objects.create(name="Plan Location", project=self.project)
-        self.field = Field.objects.create(name="Plan Field", location=self.location, project=self.project)
-        self.bed = Bed.objects.create(name="Plan Bed", field=self.field, project=self.project)
-        self.culture = Culture.objects.create(name="Plan Culture", growth_duration_days=7, harvest_duration_days=2, project=self.project)
+        self.assertEqual(remaining.overlapping_used_area_sqm, Decimal('0.00'))
+        self.assertEqual(remaining.remaining_area_sqm, Decimal('20'))
 
-        self.plan_without_attachments = PlantingPlan.objects.create(
-            culture=self.culture, bed=self.bed, planting_date=date(2024, 3, 1), notes='No attachments',
-            project=self.project,
-        )
-        self.plan_with_attachments = PlantingPlan.objects.create(
-            culture=self.culture, bed=self.bed, planting_date=date(2024, 3, 2), notes='With attachments',
-            project=self.project,
+
+class PlantingPlanAttachmentCountApiTest(DRFAPITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.plans_url = reverse('plantingplan-list')
+        cls.user = User.objects.create_user(username='attachcountuser', email='attachcount@example.com', password='testpass', is_active=True)
+        cls.project = Project.objects.create(name='Attach Count Project', slug='attach-count-project')
+        ProjectMembership.objects.create(user=cls.user, project=cls.project, role='admin')
+        cls.location, cls.field, cls.bed = make_farm(
+            cls.project,
+            location_name="Plan Location",
+            field_name="Plan Field",
+            bed_name="Plan Bed",
         )
+        cls.culture = Culture.objects.create(name="Plan Culture", growth_duration_days=7, harvest_duration_days=2, project=cls.project)
 
-        NoteAttachment.objects.create(
-            planting_plan=self.plan_with_attachments,
-            image='notes/test-1.webp',
-            mime_type='image/webp',
-            width=100,
-            height=100,
-            size_bytes=1000,
-            project=self.project,
+        cls.plan_without_attachments = PlantingPlan.objects.create(
+            culture=cls.culture, bed=cls.bed, planting_date=date(2024, 3, 1), notes='No attachments',
+            project=cls.project,
         )
-        NoteAttachment.objects.create(
-            planting_plan=self.plan_with_attachments,
-            image='notes/test-2.webp',
-            mime_type='image/webp',
-            width=100,
-            height=100,
-            size_bytes=1000,
-            project=self.project,
+        cls.plan_with_attachments = PlantingPlan.objects.create(
+            culture=cls.culture, bed=cls.bed, planting_date=date(2024, 3, 2), notes='With attachments',
+            project=cls.project,
         )
 
+        NoteAttachment.objects.bulk_create([
+            NoteAttachment(
+                planting_plan=cls.plan_with_attachments,
+                image=f'notes/test-{index}.webp',
+                mime_type='image/webp',
+                width=100,
+                height=100,
+                size_bytes=1000,
+                project=cls.project,
+            )
+            for index in (1, 2)
+        ])
+
+    def setUp(self):
+        self.client.force_authenticate(user=self.user)
+        self.client.defaults['HTTP_X_PROJECT_ID'] = str(self.project.id)
+
     def test_planting_plan_list_contains_attachment_count(self):
-        response = self.client.get('/openfarmplanner/api/planting-plans/')
+        response = self.client.get(self.plans_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
 
         by_id = {item['id']: item for item in response.data['results']}
@@ -550,6 +576,6 @@ class PlantingPlanAttachmentCountApiTest(DRFAPITestCase):
         # request in its own transaction, nested as a savepoint under the test's outer
         # transaction).
         with self.assertNumQueries(5):
-            response = self.client.get('/openfarmplanner/api/planting-plans/')
+            response = self.client.get(self.plans_url)
             self.assertEqual(response.status_code, status.HTTP_200_OK)
 
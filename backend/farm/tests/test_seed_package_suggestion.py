@@ -123,3 +123,20 @@ def test_seed_package_suggestion_ignores_duplicate_package_sizes():
     assert result.total_amount == Decimal('35')
     assert result.pack_count == 2
     assert _selection_dict(result) == {Decimal('25'): 1, Decimal('10'): 1}
+
+
+def test_seed_package_suggestion_handles_large_amounts_with_many_sizes():
+    result = compute_seed_package_suggestion(
+        required_amount=Decimal('2303'),
+        packages=[
+            PackageOption(size_value=Decimal('3'), size_unit='g'),
+            PackageOption(size_value=Decimal('2.5'), size_unit='g'),
+            PackageOption(size_value=Decimal('7.5'), size_unit='g'),
+            PackageOption(size_value=Decimal('5'), size_unit='g'),
+        ],
+        unit='g',
+    )
+    assert result.total_amount == Decimal('2303')
+    assert result.overage == Decimal('0')
+    assert result.pack_count == 308
+    assert _selection_dict(result) == {Decimal('3'): 1, Decimal('5'): 1, Decimal('7.5'): 306}
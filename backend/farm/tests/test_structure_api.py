@@ -137,7 +137,7 @@ class StructureApiTest(ProjectApiTestCase):
         foreign_location = Location.objects.create(name='Foreign location', project=other_project)
 
         response = self.client.post(
-            '/openfarmplanner/api/fields/',
+            self.fields_url,
             {
                 'name': 'Cross-project field',
                 'location': foreign_location.id,
@@ -190,10 +190,27 @@ class StructureApiTest(ProjectApiTestCase):
         self.assertIsNone(self.bed.width_m)
 
     def test_bed_list(self):
-        response = self.client.get('/openfarmplanner/api/beds/')
+        response = self.client.get(self.beds_url)
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(len(response.data['results']), 1)
 
+    def test_bed_list_query_count_does_not_scale_with_result_count(self):
+        # 5 queries: SAVEPOINT + project membership lookup + COUNT (pagination)
+        # + page SELECT + RELEASE SAVEPOINT, independent of the number of beds.
+        with self.assertNumQueries(5):
+            response = self.client.get(self.beds_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        Bed.objects.bulk_create([
+            Bed(name=f'Extra Bed {index}', field=self.field, area_sqm=5.0, project=self.project)
+            for index in range(20)
+        ])
+
+        with self.assertNumQueries(5):
+            response = self.client.get(self.beds_url)
+            self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(len(response.data['results']), 21)
+
     def test_field_create_with_valid_area(self):
         data = {
             'name': 'Valid Field',
@@ -201,7 +218,7 @@ class StructureApiTest(ProjectApiTestCase):
             'area_sqm': 500.50,
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/fields/', data)
+        response = self.client.post(self.fields_url, data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Field.objects.count(), 2)
 
@@ -212,7 +229,7 @@ class StructureApiTest(ProjectApiTestCase):
             'area_sqm': 0.001,
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/fields/', data)
+        response = self.client.post(self.fields_url, data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('area_sqm', response.data)
 
@@ -223,7 +240,7 @@ class StructureApiTest(ProjectApiTestCase):
             'area_sqm': 2000000,  # Greater than MAX_AREA_SQM (1,000,000)
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/fields/', data)
+        response = self.client.post(self.fields_url, data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('area_sqm', response.data)
 
@@ -234,7 +251,7 @@ class StructureApiTest(ProjectApiTestCase):
             'area_sqm': 50.2,
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/beds/', data)
+        response = self.client.post(self.beds_url, data)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(Bed.objects.count(), 2)
 
@@ -245,7 +262,7 @@ class StructureApiTest(ProjectApiTestCase):
             'area_sqm': 0.001,
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/beds/', data)
+        response = self.client.post(self.beds_url, data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('area_sqm', response.data)
 
@@ -256,7 +273,7 @@ class StructureApiTest(ProjectApiTestCase):
             'area_sqm': 20000,
             'project': self.project.id,
         }
-        response = self.client.post('/openfarmplanner/api/beds/', data)
+        response = self.client.post(self.beds_url, data)
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
         self.assertIn('area_sqm', response.data)
 
@@ -264,14 +281,17 @@ class StructureApiTest(ProjectApiTestCase):
 class CultureLayoutApiTest(DRFAPITestCase):
     """Tests for the bed/field layout endpoint on locations."""
 
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(username='layoutuser', email='layoutuser@example.com', password='testpass', is_active=True)
+        cls.project = Project.objects.create(name='Layout Project', slug='layout-project')
+        ProjectMembership.objects.create(user=cls.user, project=cls.project, role='admin')
+        cls.supplier = Supplier.objects.create(name='Default Supplier', homepage_url='https://supplier.example', project=cls.project)
+        cls.culture = Culture.objects.create(name='Tomate', variety='Roma', supplier=cls.supplier, supplier_product_url='https://supplier.example/tomate', project=cls.project)
+
     def setUp(self):
-        self.user = User.objects.create_user(username='layoutuser', email='layoutuser@example.com', password='testpass', is_active=True)
-        self.project = Project.objects.create(name='Layout Project', slug='layout-project')
-        ProjectMembership.objects.create(user=self.user, project=self.project, role='admin')
         self.client.force_authenticate(user=self.user)
         self.client.defaults['HTTP_X_PROJECT_ID'] = str(self.project.id)
-        self.supplier = Supplier.objects.create(name='Default Supplier', homepage_url='https://supplier.example', project=self.project)
-        self.culture = Culture.objects.create(name='Tomate', variety='Roma', supplier=self.supplier, supplier_product_url='https://supplier.example/tomate', project=self.project)
 
     def test_layouts_get_and_put(self):
         location = Location.objects.create(name='Layout test location', project=self.project)
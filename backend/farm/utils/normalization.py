@@ -6,6 +6,21 @@ supplier names) for consistent matching and deduplication in the database.
 
 import re
 
+_LEGAL_SUFFIX_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r'\s+co\.?\s+kg\s*$',  # Match "co. kg" or "co kg" first
+        r'\s+e\.u\.\s*$',
+        r'\s+ltd\.?\s*$',
+        r'\s+inc\.?\s*$',
+        r'\s+gmbh\s*$',
+        r'\s+gbr\s*$',
+        r'\s+kg\s*$',
+        r'\s+og\s*$',
+        r'\s+ag\s*$',
+    )
+)
+
 
 def normalize_text(value: str | None) -> str | None:
     """Normalize text for matching and deduplication.
@@ -52,20 +67,8 @@ def normalize_supplier_name(value: str | None) -> str | None:
         return None
     
     # Remove common legal suffixes (order matters - match longer patterns first)
-    legal_suffixes = [
-        r'\s+co\.?\s+kg\s*$',  # Match "co. kg" or "co kg" first
-        r'\s+e\.u\.\s*$',
-        r'\s+ltd\.?\s*$',
-        r'\s+inc\.?\s*$',
-        r'\s+gmbh\s*$',
-        r'\s+gbr\s*$',
-        r'\s+kg\s*$',
-        r'\s+og\s*$',
-        r'\s+ag\s*$',
-    ]
-    
-    for suffix in legal_suffixes:
-        normalized = re.sub(suffix, '', normalized, flags=re.IGNORECASE)
+    for suffix_pattern in _LEGAL_SUFFIX_PATTERNS:
+        normalized = suffix_pattern.sub('', normalized)
     
     # Final trim
     normalized = normalized.strip()